@@ -1,24 +1,280 @@
-
+import argparse
+import copy
+import functools
+import glob
+import gzip
+import hashlib
+import io
 import json
 import os
 import sys
 import re
-from docx import Document
-from docx.shared import Inches, Pt, RGBColor
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn
-from docx.oxml import OxmlElement
+import string
+import subprocess
+import types
+import zipfile
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from xml.sax.saxutils import escape as xml_escape
+
+try:
+    import orjson  # Optional: C-speed JSON parsing
+except ImportError:
+    orjson = None
+
+# JSON entry points, picked once: orjson when installed, stdlib json otherwise.
+# _dumps_sorted is only used for hashing, so the two need not match byte-for-byte.
+if orjson is not None:
+    _loads = orjson.loads  # orjson.JSONDecodeError subclasses json's
+
+    def _dumps_sorted(obj):
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+else:
+    _loads = json.loads
+
+    def _dumps_sorted(obj):
+        return json.dumps(obj, sort_keys=True).encode('utf-8')
 
 # ---------------------------------------------------------
 # CONSTANTS & CONFIG
 # ---------------------------------------------------------
 DATA_FILE = "data.json"
 OUTPUT_DIR = "Output"
+TEMPLATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "templates")
+
+# Defaults for optional data.json fields, resolved once at load time
+DEFAULTS = {
+    "id": "UNKNOWN",
+    "uni_name": "University",
+    "course_name": "Thesis",
+    "year": "2026",
+    "verified_year": 2025,  # Missing -> treated as stale (triggers warning)
+    "font": {"name": "Times New Roman", "size": 12},
+    "margins": {"top": 1.0, "bottom": 1.0, "left": 1.0, "right": 1.0},
+    "line_spacing": 1.5,
+    "binding": "single",
+    "reference_style": "Standard",
+    "preliminary_order": [],
+}
+# Default inside (binding-edge) margin for double-sided binding
+DOUBLE_BINDING_LEFT = 1.5
+
+# Per-university sidecar holding the hash of the inputs its output was built from
+STAMP_FILE = ".stamp"
+
+# Pages load Tailwind from the CDN unless --tailwind compiles a local stylesheet
+TAILWIND_CDN_TAG = '<script src="https://cdn.tailwindcss.com"></script>'
+# Seconds allowed for the Tailwind CLI (npx may have to download it first)
+TAILWIND_TIMEOUT = 120
+
+# zlib level for .docx parts. python-docx uses the default (6); on these small
+# XML parts level 1 is several times cheaper for a negligible size increase.
+DOCX_COMPRESSLEVEL = 1
+# FAST_SAVE=1 skips deflate entirely (ZIP_STORED): fastest save, larger files.
+DOCX_COMPRESSION = zipfile.ZIP_STORED if os.environ.get("FAST_SAVE") == "1" else zipfile.ZIP_DEFLATED
+
+# Root namespace declaration for parsing w:-prefixed fragments
+_W_NSDECL = 'xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+
+# Complex-field run (begin / instruction / separate / end)
+_FIELD_RUN_XML = (
+    '<w:r>'
+    '<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">{instr}</w:instrText>'
+    '<w:fldChar w:fldCharType="separate"/>'
+    '<w:fldChar w:fldCharType="end"/>'
+    '</w:r>'
+)
+# TOC with levels 1-3, hyperlinks, outline levels
+_TOC_FIELD_RUN_XML = _FIELD_RUN_XML.format(instr='TOC \\o "1-3" \\h \\z \\u')
+_PAGE_FIELD_RUN_XML = _FIELD_RUN_XML.format(instr='PAGE')
+
+_PAGE_BREAK_XML = '<w:p><w:r><w:br w:type="page"/></w:r></w:p>'
+
+# Title-page student block (line breaks become w:br, see _run_xml)
+STUDENT_BLOCK = "\n\n\n[STUDENT NAME]\n[ID NUMBER]\n\n\n[MONTH, YEAR]"
+
+# Core chapters (dummy content), as raw WordprocessingML per chapter;
+# {i}/{chapter}/{caption} vary. The skeleton is identical for every
+# university, so it is parsed once (CHAPTER_SKELETON in _docx()) and deep-copied.
+CHAPTERS = ["Introduction", "Literature Review", "Methodology", "Results & Discussion", "Conclusion"]
+_CHAPTER_XML = (
+    '<w:p><w:pPr><w:pStyle w:val="Heading1"/></w:pPr><w:r><w:t>Chapter {i}: {chapter}</w:t></w:r></w:p>'
+    '<w:p><w:pPr/><w:r><w:t>This is the start of the {chapter}. The formatting below demonstrates subhearings.</w:t></w:r></w:p>'
+    '<w:p><w:pPr><w:pStyle w:val="Heading2"/></w:pPr><w:r><w:t>Section 1.1: Context</w:t></w:r></w:p>'
+    '<w:p><w:pPr/><w:r><w:t>Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.</w:t></w:r></w:p>'
+    '<w:p><w:pPr><w:pStyle w:val="Heading3"/></w:pPr><w:r><w:t>Subsection 1.1.1: Detail</w:t></w:r></w:p>'
+    '<w:p><w:pPr/><w:r><w:t>Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.</w:t></w:r></w:p>'
+    '{caption}'
+    + _PAGE_BREAK_XML
+)
+# Placeholder figure caption, added to chapter 3
+_CAPTION_XML = '<w:p><w:pPr><w:pStyle w:val="Caption"/></w:pPr><w:r><w:t>[Figure 1: Conceptual Framework]</w:t></w:r></w:p>'
 
 # ---------------------------------------------------------
 # HELPER FUNCTIONS
 # ---------------------------------------------------------
 
+def _zip_pkg_writer_init(self, pkg_file):
+    """python-docx's zip writer, but with DOCX_COMPRESSION / DOCX_COMPRESSLEVEL."""
+    self._zipf = zipfile.ZipFile(
+        pkg_file, "w", compression=DOCX_COMPRESSION, compresslevel=DOCX_COMPRESSLEVEL
+    )
+
+# python-docx is only imported (by _docx()) once a document is actually built,
+# so a run where every university is up to date skips the ~90 ms import.
+@functools.lru_cache(maxsize=None)
+def _docx():
+    """
+    Imports python-docx on first use and returns a namespace with the API
+    pieces used here plus everything derived from them (built once): fixed
+    style values, the parsed page-number field run and the chapter skeleton.
+    Also routes every doc.save() through _zip_pkg_writer_init.
+    """
+    from docx import Document
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    from docx.opc import phys_pkg
+    from docx.oxml import parse_xml
+    from docx.shared import Inches, Pt, RGBColor
+
+    phys_pkg._ZipPkgWriter.__init__ = _zip_pkg_writer_init
+
+    def parse_body(xml):
+        return parse_xml(f'<w:body {_W_NSDECL}>{xml}</w:body>')
+
+    return types.SimpleNamespace(
+        Document=Document,
+        Inches=Inches,
+        Pt=Pt,
+        WD_ALIGN_PARAGRAPH=WD_ALIGN_PARAGRAPH,
+        parse_body=parse_body,
+        # Fixed style values shared by every document (not built per style/uni)
+        PT_6=Pt(6), PT_10=Pt(10), PT_12=Pt(12), PT_14=Pt(14),
+        PT_16=Pt(16), PT_18=Pt(18), PT_24=Pt(24),
+        BLACK=RGBColor(0, 0, 0),
+        # Footer page-number field run, parsed once and deep-copied per layout
+        PAGE_FIELD_RUN=parse_body(_PAGE_FIELD_RUN_XML)[0],
+        # Whole 5-chapter body, wrapped in a w:body so one deepcopy clones it all
+        CHAPTER_SKELETON=parse_body(''.join(
+            _CHAPTER_XML.format(i=i, chapter=xml_escape(chapter), caption=_CAPTION_XML if i == 3 else '')
+            for i, chapter in enumerate(CHAPTERS, 1)
+        )),
+    )
+
+def _parse_blocks(xml):
+    """Parses a run of WordprocessingML siblings (w: prefix) into a list of elements."""
+    return list(_docx().parse_body(xml))
+
+def _insert_blocks(body, elements):
+    """Inserts block elements into w:body in one step, ahead of the trailing w:sectPr."""
+    sectPr = body.sectPr
+    pos = body.index(sectPr) if sectPr is not None else len(body)
+    body[pos:pos] = elements
+
+# Characters the run.text setter turns into elements instead of w:t text
+_RUN_SPECIALS = re.compile(r'([\t\r\n])')
+
+def _run_xml(text):
+    """
+    Raw XML for a w:r holding `text`, as python-docx's run.text setter writes
+    it: "\t" becomes w:tab, "\r"/"\n" each become w:br, the rest w:t pieces.
+    """
+    parts = []
+    for piece in _RUN_SPECIALS.split(text):
+        if piece == '\t':
+            parts.append('<w:tab/>')
+        elif piece == '\r' or piece == '\n':
+            parts.append('<w:br/>')
+        elif piece:
+            space = ' xml:space="preserve"' if piece != piece.strip() else ''
+            parts.append(f'<w:t{space}>{xml_escape(piece)}</w:t>')
+    return f'<w:r>{"".join(parts)}</w:r>'
+
+def _para_xml(text, style_id=None, center=False):
+    """
+    Raw XML for a single-run paragraph, as add_paragraph(text, style) writes it.
+    A style_id of None means the default (Normal) style; center=True is
+    the alignment = CENTER of an unstyled paragraph.
+    """
+    if center:
+        pPr = '<w:pPr><w:jc w:val="center"/></w:pPr>'
+    elif style_id:
+        pPr = f'<w:pPr><w:pStyle w:val="{style_id}"/></w:pPr>'
+    else:
+        pPr = '<w:pPr/>'
+    return f'<w:p>{pPr}{_run_xml(text)}</w:p>'
+
+def _code_digest():
+    """Fingerprint of this generator and its page templates."""
+    h = hashlib.blake2b(digest_size=16)
+    paths = [__file__] + sorted(glob.glob(os.path.join(TEMPLATE_DIR, "*.html")))
+    for path in paths:
+        with open(path, 'rb') as f:
+            h.update(f.read())
+    return h.digest()
+
+# Editing the code or a template invalidates every stamp.
+_CODE_DIGEST = _code_digest()
+
+def build_key(uni_data, css_name=None):
+    """Stable hash of a build's inputs (its data + the generator code + stylesheet)."""
+    h = hashlib.blake2b(_CODE_DIGEST, digest_size=16)
+    h.update(bytes([DOCX_COMPRESSION]))  # toggling FAST_SAVE rebuilds the .docx
+    if css_name:
+        h.update(css_name.encode('utf-8'))
+    h.update(_dumps_sorted(uni_data))
+    return h.hexdigest()
+
+def write_file(path, data):
+    """
+    Writes a whole file with one os.open + os.write (str is UTF-8 encoded).
+    No Python file object or intermediate buffer copy is involved.
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def write_files(files):
+    """
+    Flushes a batch of rendered (path, data) outputs back to back.
+    Everything is rendered in memory first, so a failure while building
+    leaves no half-written set of files behind.
+    """
+    for path, data in files:
+        write_file(path, data)
+
+def gzip_html(html):
+    """
+    Precompressed copy of a page, served as index.html.gz by static hosts.
+    Level 9 is paid once at build time; mtime=0 keeps rebuilds byte-identical.
+    """
+    return gzip.compress(html.encode('utf-8'), compresslevel=9, mtime=0)
+
+def read_stamp(path):
+    """Returns the stored build key, or None if there is no stamp yet."""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+_SANITIZE_STRIP = re.compile(r'[^\w\s-]')
+_SANITIZE_JOIN = re.compile(r'[-\s]+')
+# ASCII fast path for the two regexes above: drop every char that is not a
+# word char, whitespace or '-', and turn '-' into a separator.
+_SANITIZE_TABLE = {
+    c: None for c in range(128)
+    if not (chr(c).isalnum() or chr(c).isspace() or chr(c) in '-_')
+}
+_SANITIZE_TABLE[ord('-')] = ' '
+
+@functools.lru_cache(maxsize=256)
 def sanitize_filename(name):
     """
     Sanitizes string for filesystem and SEO-friendly usage.
@@ -26,48 +282,63 @@ def sanitize_filename(name):
     """
     # Remove things in parens if they are just abbreviations like (MIT), but keeping them is fine if sanitized.
     # User requested: Replace spaces with underscores, remove special chars.
-    clean = re.sub(r'[^\w\s-]', '', name)
-    clean = re.sub(r'[-\s]+', '_', clean).strip('-_')
+    if name.isascii():
+        return '_'.join(name.translate(_SANITIZE_TABLE).split()).strip('-_')
+    clean = _SANITIZE_STRIP.sub('', name)
+    clean = _SANITIZE_JOIN.sub('_', clean).strip('-_')
     return clean
 
-def add_toc_field(paragraph):
+def with_defaults(uni):
     """
-    Inserts a Word Table of Contents (TOC) field into a paragraph.
-    Note: The user must right-click > Update Field in Word to populate it.
+    Returns a plain dict of one university's settings with every optional
+    field (including nested font/margins) filled in from DEFAULTS, so the
+    generators can index directly instead of repeating .get() defaults.
+    Raises ValueError if the id can't name an output directory.
     """
-    run = paragraph.add_run()
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'begin')
-    run._r.append(fldChar)
-
-    instrText = OxmlElement('w:instrText')
-    instrText.set(qn('xml:space'), 'preserve')
-    # TOC with levels 1-3, hyperlinks, outline levels
-    instrText.text = 'TOC \\o "1-3" \\h \\z \\u'
-    run._r.append(instrText)
-
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'separate')
-    run._r.append(fldChar)
-
-    fldChar = OxmlElement('w:fldChar')
-    fldChar.set(qn('w:fldCharType'), 'end')
-    run._r.append(fldChar)
+    uni_font = uni.get("font") or {}
+    uni_margins = uni.get("margins") or {}
+    data = dict(ChainMap(uni, DEFAULTS))
+    if not isinstance(data["id"], str) or not data["id"]:
+        raise ValueError(f"id must be a non-empty string, got {data['id']!r}")
+    data["font"] = dict(ChainMap(uni_font, DEFAULTS["font"]))
+    margins = dict(ChainMap(uni_margins, DEFAULTS["margins"]))
+    if data["binding"] == "double" and "left" not in uni_margins:
+        margins["left"] = DOUBLE_BINDING_LEFT
+    data["margins"] = margins
+    return data
+
+def load_universities(path):
+    """
+    Reads data.json (with orjson when installed, stdlib json otherwise) and
+    resolves defaults for every university.
+    A malformed entry is reported by id and left out; the rest still build.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    universities = []
+    for uni in _loads(raw):
+        try:
+            universities.append(with_defaults(uni))
+        except Exception as e:
+            uni_id = uni.get('id', 'Unknown') if isinstance(uni, dict) else 'Unknown'
+            print(f"⚠️ Failed to process {uni_id}: {e}")
+    return universities
 
 def configure_styles(doc, font_data, line_spacing):
     """
     Configures the base styles (Normal, Headings) to match requirements.
     This avoids manual formatting on paragraphs.
     """
+    dx = _docx()
     styles = doc.styles
-    font_name = font_data.get("name", "Times New Roman")
-    font_size = font_data.get("size", 12)
+    font_name = font_data["name"]
+    font_size = font_data["size"]
 
     # 1. Normal Style
     style_normal = styles['Normal']
     font = style_normal.font
     font.name = font_name
-    font.size = Pt(font_size)
+    font.size = dx.Pt(font_size)
     
     # Paragraph format
     pf = style_normal.paragraph_format
@@ -84,40 +355,40 @@ def configure_styles(doc, font_data, line_spacing):
     style_h1 = styles['Heading 1']
     h1_font = style_h1.font
     h1_font.name = font_name
-    h1_font.size = Pt(16)
+    h1_font.size = dx.PT_16
     h1_font.bold = True
-    h1_font.color.rgb = RGBColor(0, 0, 0) # Force Black
-    style_h1.paragraph_format.space_before = Pt(24)
-    style_h1.paragraph_format.space_after = Pt(12)
+    h1_font.color.rgb = dx.BLACK # Force Black
+    style_h1.paragraph_format.space_before = dx.PT_24
+    style_h1.paragraph_format.space_after = dx.PT_12
 
     # 3. Heading 2 (Section Level)
     style_h2 = styles['Heading 2']
     h2_font = style_h2.font
     h2_font.name = font_name
-    h2_font.size = Pt(14)
+    h2_font.size = dx.PT_14
     h2_font.bold = True
-    h2_font.color.rgb = RGBColor(0, 0, 0)
-    style_h2.paragraph_format.space_before = Pt(18)
-    style_h2.paragraph_format.space_after = Pt(6)
+    h2_font.color.rgb = dx.BLACK
+    style_h2.paragraph_format.space_before = dx.PT_18
+    style_h2.paragraph_format.space_after = dx.PT_6
 
     # 4. Heading 3 (Subsection Level)
     style_h3 = styles['Heading 3']
     h3_font = style_h3.font
     h3_font.name = font_name
-    h3_font.size = Pt(12)
+    h3_font.size = dx.PT_12
     h3_font.bold = True
-    h3_font.color.rgb = RGBColor(0, 0, 0)
-    style_h3.paragraph_format.space_before = Pt(12)
-    style_h3.paragraph_format.space_after = Pt(6)
+    h3_font.color.rgb = dx.BLACK
+    style_h3.paragraph_format.space_before = dx.PT_12
+    style_h3.paragraph_format.space_after = dx.PT_6
     
     # 5. Caption Style
     if 'Caption' in styles:
         style_caption = styles['Caption']
         c_font = style_caption.font
         c_font.name = font_name
-        c_font.size = Pt(10)
+        c_font.size = dx.PT_10
         c_font.italic = True
-        c_font.color.rgb = RGBColor(0, 0, 0)
+        c_font.color.rgb = dx.BLACK
 
 
 def setup_margins(doc, margins, binding="single"):
@@ -125,20 +396,20 @@ def setup_margins(doc, margins, binding="single"):
     Applies margin settings to the document.
     Handles 'mirror margins' for physical binding if requested.
     """
+    dx = _docx()
     sections = doc.sections
     for section in sections:
-        section.top_margin = Inches(margins.get("top", 1.0))
-        section.bottom_margin = Inches(margins.get("bottom", 1.0))
-        section.left_margin = Inches(margins.get("left", 1.0))
-        section.right_margin = Inches(margins.get("right", 1.0))
+        section.top_margin = dx.Inches(margins["top"])
+        section.bottom_margin = dx.Inches(margins["bottom"])
+        section.left_margin = dx.Inches(margins["left"])
+        section.right_margin = dx.Inches(margins["right"])
         
         # Mirror Margins Logic
         if binding == "double":
             section.mirror_margins = True
             # In Word, "Left" becomes "Inside" and "Right" becomes "Outside" when mirrored.
-            # We assume the JSON 'left' meant 'binding edge' (Inside).
-            section.left_margin = Inches(margins.get("left", 1.5)) # Inside
-            section.right_margin = Inches(margins.get("right", 1.0)) # Outside
+            # We assume the JSON 'left' meant 'binding edge' (Inside), which is
+            # why with_defaults gives it the wider DOUBLE_BINDING_LEFT default.
 
 def add_simple_page_numbers(doc):
     """Adds a basic page number in the footer."""
@@ -148,117 +419,148 @@ def add_simple_page_numbers(doc):
     section = doc.sections[0]
     footer = section.footer
     p = footer.paragraphs[0]
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    run = p.add_run()
-    fldChar1 = OxmlElement('w:fldChar')
-    fldChar1.set(qn('w:fldCharType'), 'begin')
-    run._r.append(fldChar1)
-    
-    instrText = OxmlElement('w:instrText')
-    instrText.set(qn('xml:space'), 'preserve')
-    instrText.text = "PAGE"
-    run._r.append(instrText)
-    
-    fldChar2 = OxmlElement('w:fldChar')
-    fldChar2.set(qn('w:fldCharType'), 'separate')
-    run._r.append(fldChar2)
-    
-    fldChar3 = OxmlElement('w:fldChar')
-    fldChar3.set(qn('w:fldCharType'), 'end')
-    run._r.append(fldChar3)
+    dx = _docx()
+    p.alignment = dx.WD_ALIGN_PARAGRAPH.CENTER
+    p._p.append(copy.deepcopy(dx.PAGE_FIELD_RUN))
+
+@functools.lru_cache(maxsize=None)
+def _blank_docx_bytes():
+    """
+    python-docx's blank template as in-memory .docx bytes.
+    Document() would re-read and unzip the template from disk on every call.
+    """
+    buf = io.BytesIO()
+    _docx().Document().save(buf)
+    return buf.getvalue()
+
+@functools.lru_cache(maxsize=32)
+def _base_docx_bytes(font_name, font_size, line_spacing, margins_key, binding):
+    """
+    Builds (once per distinct layout) an empty document with margins, styles
+    and footer page numbers applied, serialized to .docx bytes.
+    Universities sharing a layout reopen these bytes instead of redoing setup.
+    """
+    doc = _docx().Document(io.BytesIO(_blank_docx_bytes()))
+    setup_margins(doc, dict(margins_key), binding)
+    configure_styles(doc, {"name": font_name, "size": font_size}, line_spacing)
+    add_simple_page_numbers(doc)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
 
 # ---------------------------------------------------------
 # MAIN GENERATOR
 # ---------------------------------------------------------
 
-def process_university(uni_data):
-    uni_id = uni_data.get("id", "UNKNOWN")
-    uni_name = uni_data.get("uni_name", "University")
-    course = uni_data.get("course_name", "Thesis")
+def build_university(uni_data, force=False, css_name=None):
+    """
+    Builds all artifacts for one university (docx, README, web page) in a
+    single pass, deriving the shared names and paths only once.
+    Skipped when the stamp shows the output is already up to date and
+    every output file is still on disk.
+    The target directory must exist (main creates them all up front).
+    """
+    uni_id = uni_data["id"]
+    uni_name = uni_data["uni_name"]
+    course = uni_data["course_name"]
     
     # Path setup
     target_dir = os.path.join(OUTPUT_DIR, uni_id)
-    if not os.path.exists(target_dir):
-        os.makedirs(target_dir)
-        
     doc_name = f"{sanitize_filename(uni_name)}_Thesis_Template_2026.docx"
     doc_path = os.path.join(target_dir, doc_name)
     readme_path = os.path.join(target_dir, "README.md")
+    page_path = os.path.join(target_dir, "index.html")
+    outputs = (doc_path, readme_path, page_path, page_path + ".gz")
     
-    # 1. Initialize Document
-    doc = Document()
+    # Incremental build: same inputs + same code -> same output
+    stamp_path = os.path.join(target_dir, STAMP_FILE)
+    key = build_key(uni_data, css_name)
+    if (not force and read_stamp(stamp_path) == key
+            and all(os.path.exists(p) for p in outputs)):
+        print(f"⏭️ Up to date: {uni_name} - {course}")
+        return
     
-    # 2. Setup Page Layout (Margins & Binding)
-    setup_margins(doc, uni_data.get("margins", {}), uni_data.get("binding", "single"))
+    # Render everything in memory, then write the batch in one go.
+    # The stamp goes last, so an interrupted build is redone next run.
+    page = generate_web_page(uni_data, uni_name, course, doc_name, css_name)
+    write_files([
+        (doc_path, generate_docx(uni_data, uni_name, course)),
+        (readme_path, generate_readme(uni_data, doc_name)),
+        (page_path, page),
+        (page_path + ".gz", gzip_html(page)),
+        (stamp_path, key),
+    ])
     
-    # 3. Setup Styles (Fonts)
-    configure_styles(doc, uni_data.get("font", {}), uni_data.get("line_spacing", 1.5))
+    print(f"✅ Generated {uni_name} - {course}")
+
+def generate_docx(uni_data, uni_name, course):
+    """Builds the thesis template document itself; returns the .docx bytes."""
+    # 1-3. Initialize Document with Margins/Binding, Styles and Page Numbers
+    #      (built once per distinct layout, then reopened from memory)
+    font = uni_data["font"]
+    base = _base_docx_bytes(
+        font["name"],
+        font["size"],
+        uni_data["line_spacing"],
+        tuple(sorted(uni_data["margins"].items())),
+        uni_data["binding"],
+    )
+    doc = _docx().Document(io.BytesIO(base))
     
-    # 4. Preliminary Pages
-    prelims = uni_data.get("preliminary_order", [])
+    # 4-6. Title page, preliminary pages, chapters and references are
+    #      assembled as one XML fragment and inserted in a single step.
+    body = doc.element.body
+    prelims = uni_data["preliminary_order"]
     
     # Title Page (Manual formatting permissible here for Title look, but trying to use styles)
     # But usually Title page has no style. We will use Normal centered.
-    doc.add_heading(uni_name, 0)
-    p = doc.add_paragraph(f"{course} Thesis Template")
-    p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-    doc.add_paragraph("\n\n\n[STUDENT NAME]\n[ID NUMBER]\n\n\n[MONTH, YEAR]", style='Normal').alignment = WD_ALIGN_PARAGRAPH.CENTER
-    doc.add_page_break()
+    front_xml = [
+        _para_xml(uni_name, 'Title'),
+        _para_xml(f"{course} Thesis Template", center=True),
+        _para_xml(STUDENT_BLOCK, center=True),
+        _PAGE_BREAK_XML,
+    ]
     
+    # Remaining preliminary pages
     for page_title in prelims:
         if page_title == "Title Page": 
             continue # Already done
         
+        front_xml.append(_para_xml(page_title, 'Heading1'))
         # If it's TOC, handle specially
         if page_title == "Table of Contents":
-            doc.add_heading("Table of Contents", level=1)
-            p = doc.add_paragraph()
-            add_toc_field(p)
-            doc.add_page_break()
-            continue
-
-        doc.add_heading(page_title, level=1)
-        doc.add_paragraph(f"[{page_title} Content Goes Here]", style='Normal')
-        doc.add_page_break()
-        
-    # 5. Core Chapters (Dummy Content)
-    chapters = ["Introduction", "Literature Review", "Methodology", "Results & Discussion", "Conclusion"]
+            front_xml.append(f'<w:p>{_TOC_FIELD_RUN_XML}</w:p>')
+        else:
+            front_xml.append(_para_xml(f"[{page_title} Content Goes Here]"))
+        front_xml.append(_PAGE_BREAK_XML)
     
-    for i, chapter in enumerate(chapters, 1):
-        doc.add_heading(f"Chapter {i}: {chapter}", level=1)
-        doc.add_paragraph(f"This is the start of the {chapter}. The formatting below demonstrates subhearings.", style='Normal')
-        
-        doc.add_heading("Section 1.1: Context", level=2)
-        doc.add_paragraph("Lorem ipsum dolor sit amet, consectetur adipiscing elit. Sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.", style='Normal')
-        
-        doc.add_heading("Subsection 1.1.1: Detail", level=3)
-        doc.add_paragraph("Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat.", style='Normal')
-        
-        # Add a placeholder figure/table
-        if i == 3:
-            doc.add_paragraph("[Figure 1: Conceptual Framework]", style='Caption')
-            
-        doc.add_page_break()
-
     # 6. References
-    doc.add_heading("References", level=1)
-    doc.add_paragraph(f"[{uni_data.get('reference_style', 'APA')} Style References List]", style='Normal')
-    
-    # 7. Add Page Numbers
-    add_simple_page_numbers(doc)
+    back_xml = [
+        _para_xml("References", 'Heading1'),
+        _para_xml(f"[{uni_data['reference_style']} Style References List]"),
+    ]
     
-    # Save
-    doc.save(doc_path)
+    # 5. Core Chapters (Dummy Content), cloned from the prebuilt skeleton and
+    #    spliced between front and back matter, which share one parse
+    #    (every *_xml entry is exactly one block).
+    blocks = _parse_blocks(''.join(front_xml) + ''.join(back_xml))
+    split = len(front_xml)
+    _insert_blocks(body, blocks[:split] + list(copy.deepcopy(_docx().CHAPTER_SKELETON)) + blocks[split:])
     
-    # 8. Generate README
-    generate_readme(readme_path, uni_data, doc_name)
-    
-    print(f"✅ Generated {uni_name} - {course}")
+    # Save to memory (python-docx emits many small zip-member writes)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getbuffer()
+
+def generate_readme(data, doc_name):
+    """Returns the README.md text for one university."""
+    # Bind the nested lookups once
+    margins, font = data['margins'], data['font']
+    m_left, m_right, m_top, m_bottom = margins['left'], margins['right'], margins['top'], margins['bottom']
 
-def generate_readme(path, data, doc_name):
     # Determine Binding Note
     binding_note = ""
-    if data.get("binding") == "double":
+    if data["binding"] == "double":
         binding_note = "> **Note:** This template uses **Mirror Margins** for double-sided printing (Inside margin is wider)."
     else:
         binding_note = "> **Note:** This template uses standard **Single-Sided** margins. For physical binding, enable 'Layout > Margins > Mirror Margins' in Word."
@@ -267,7 +569,7 @@ def generate_readme(path, data, doc_name):
 
 **File:** `{doc_name}`
 **Compliance:** 2026 Academic Guidelines
-**Reference Style:** {data.get('reference_style', 'Standard')}
+**Reference Style:** {data['reference_style']}
 
 ## 🛡️ Honest Scope Disclaimer
 This is a **Formatting Compliance Starter Pack**, not a magic "write-my-thesis" tool.
@@ -296,40 +598,44 @@ I have handled the **Margins**, **Fonts**, and **Structure** so you can focus on
 {binding_note}
 
 ## 📋 Compliance Checklist
-- [x] **Font:** {data['font']['name']} ({data['font']['size']}pt)
-- [x] **Margins:** L:{data['margins']['left']}" R:{data['margins']['right']}" T:{data['margins']['top']}" B:{data['margins']['bottom']}"
+- [x] **Font:** {font['name']} ({font['size']}pt)
+- [x] **Margins:** L:{m_left}" R:{m_right}" T:{m_top}" B:{m_bottom}"
 - [x] **Structure:** Preliminary pages ordered correctly.
 - [x] **Source:** Verified against official {data['year']} guidelines.
 
 ---
 *Factory Generated (v2.1 - Compliance Safe)*
 """
-    with open(path, 'w') as f:
-        f.write(content)
+    return content
 
 
 # ---------------------------------------------------------
 # WEB GENERATOR (SEO & SEARCH & TRUST)
 # ---------------------------------------------------------
 
-def generate_web_page(target_dir, uni_data):
-    """Generates an SEO-optimized HTML landing page with SaaS-grade Trust UI (Tailwind)."""
-    html_path = os.path.join(target_dir, "index.html")
-    
-    uni_name = uni_data.get('uni_name', 'University')
-    course = uni_data.get('course_name', 'Thesis')
-    doc_name = f"{sanitize_filename(uni_name)}_Thesis_Template_2026.docx"
-    doc_link = doc_name
-    year = uni_data.get('year', '2026')
-    verified_year = uni_data.get('verified_year', 2025) # Default to 2025 if missing (triggers warning)
-    current_year = 2026
-
-    # Logic: Data Decay Warning
-    decay_warning_html = ""
-    verified_badge_html = ""
-    
-    if verified_year < current_year:
-        decay_warning_html = f"""
+# Page templates live in templates/ and are compiled once at import; only
+# the $-placeholders are filled in per page.
+def _load_template(name):
+    """Reads one page template from TEMPLATE_DIR as a string.Template."""
+    with open(os.path.join(TEMPLATE_DIR, name), encoding='utf-8') as f:
+        return string.Template(f.read())
+
+_UNI_PAGE_TMPL = _load_template("uni.html")
+_INDEX_PAGE_TMPL = _load_template("index.html")
+
+# Product JSON-LD in compact form (json.dumps(..., separators=(',', ':'))):
+# search engines read it the same as the indented form, at half the bytes.
+_JSON_LD_TMPL = string.Template(
+    '{"@context":"https://schema.org/","@type":"Product",'
+    '"name":"$name","description":"$description",'
+    '"brand":{"@type":"Brand","name":"$brand"},'
+    '"offers":{"@type":"Offer","price":"0","priceCurrency":"USD","availability":"https://schema.org/InStock"},'
+    '"aggregateRating":{"@type":"AggregateRating","ratingValue":"5","reviewCount":"127"}}'
+)
+
+# Trust UI fragments for the landing page: a warning when the guidelines were
+# last verified before the current year, a green badge otherwise.
+_DECAY_WARNING_TMPL = string.Template("""
         <div class="bg-yellow-50 border-l-4 border-yellow-400 p-4 mb-6 text-left">
             <div class="flex">
                 <div class="flex-shrink-0">
@@ -339,201 +645,118 @@ def generate_web_page(target_dir, uni_data):
                 </div>
                 <div class="ml-3">
                     <p class="text-sm text-yellow-700">
-                        <strong>Verification Warning:</strong> This template was verified for {verified_year}. 
-                        Please check with your department if the {current_year} guidelines have changed.
+                        <strong>Verification Warning:</strong> This template was verified for $verified_year. 
+                        Please check with your department if the $current_year guidelines have changed.
                     </p>
                 </div>
             </div>
         </div>
-        """
-    else:
-        verified_badge_html = f"""
+        """)
+_VERIFIED_BADGE_TMPL = string.Template("""
             <div class="inline-flex items-center gap-2 bg-green-50 text-green-700 px-3 py-1 rounded-full text-xs font-bold mb-6">
                 <span class="w-2 h-2 bg-green-500 rounded-full"></span>
-                Verified for {verified_year}
+                Verified for $verified_year
             </div>
-        """
-
-    # JSON-LD Data
-    json_ld = {
-        "@context": "https://schema.org/",
-        "@type": "Product",
-        "name": f"{uni_name} Thesis Template {year}",
-        "description": f"Official {year} compliant thesis template for {uni_name} {course}. Features correct {uni_data['margins']['left']} inch margins, {uni_data['font']['name']} font, and auto-generated Table of Contents.",
-        "brand": {
-            "@type": "Brand",
-            "name": uni_name
-        },
-        "offers": {
-            "@type": "Offer",
-            "price": "0",
-            "priceCurrency": "USD",
-            "availability": "https://schema.org/InStock"
-        },
-        "aggregateRating": {
-            "@type": "AggregateRating",
-            "ratingValue": "5",
-            "reviewCount": "127"
-        }
-    }
-
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{uni_name} Thesis Template ({year}) | Free Download</title>
-    <meta name="description" content="Download the 100% compliant {course} thesis template for {uni_name}. Pre-formatted {year} margins, styles, and citations. Free Word (.docx).">
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script type="application/ld+json">
-    {json.dumps(json_ld, indent=4)}
-    </script>
-</head>
-<body class="bg-gray-50 text-gray-800 font-sans antialiased">
-
-    <!-- Navigation -->
-    <nav class="bg-white border-b border-gray-200 py-4">
-        <div class="max-w-4xl mx-auto px-4 flex justify-between items-center">
-            <a href="../index.html" class="text-blue-600 hover:text-blue-800 font-semibold text-sm">← Back to Search</a>
-            <span class="text-xs text-gray-500 font-medium bg-gray-100 px-2 py-1 rounded">Ver 2.0 (2026)</span>
-        </div>
-    </nav>
-
-    <!-- Hero Section -->
-    <div class="bg-white pb-12 pt-12 text-center border-b border-gray-200">
-        <div class="max-w-3xl mx-auto px-4">
-            {verified_badge_html}
-            {decay_warning_html}
-            <h1 class="text-3xl md:text-5xl font-bold text-gray-900 mb-4 tracking-tight leading-tight">
-                {uni_name}<br>
-                <span class="text-blue-600">Compliance Starter Pack</span>
-            </h1>
-            <p class="text-lg text-gray-600 mb-8 max-w-2xl mx-auto">
-                I handled the margins, fonts, and structure so you can focus on writing. 
-                Based on {uni_name} {course} guidelines.
-            </p>
-            
-            <!-- CTA -->
-            <a href="{doc_link}" class="inline-flex items-center justify-center bg-blue-600 hover:bg-blue-700 text-white font-bold text-lg py-4 px-8 rounded-lg shadow-lg hover:shadow-xl transition-all transform hover:-translate-y-0.5">
-                ⬇️ Download Free Template (.docx)
-            </a>
-            <p class="text-xs text-gray-500 mt-3">No signup required • 100% Free • Secure Download</p>
-        </div>
-    </div>
+        """)
 
-    <!-- Content Grid -->
-    <div class="max-w-4xl mx-auto px-4 py-12 grid md:grid-cols-2 gap-12">
-        
-        <!-- Column 1: Specs -->
-        <div>
-            <h3 class="text-xl font-bold text-gray-900 mb-6 flex items-center">
-                <span class="bg-blue-100 text-blue-600 w-8 h-8 rounded-full flex items-center justify-center mr-3 text-sm">✓</span>
-                Compliance Specifications
-            </h3>
-            <div class="bg-white p-6 rounded-xl shadow-sm border border-gray-100">
-                <ul class="space-y-4 text-sm">
-                    <li class="flex justify-between border-b border-gray-50 pb-2">
-                        <span class="text-gray-500">Margins (Left)</span>
-                        <span class="font-mono font-medium text-gray-900 bg-gray-50 px-2 rounded">{uni_data['margins']['left']}"</span>
-                    </li>
-                    <li class="flex justify-between border-b border-gray-50 pb-2">
-                        <span class="text-gray-500">Margins (Others)</span>
-                        <span class="font-mono font-medium text-gray-900 bg-gray-50 px-2 rounded">R: {uni_data['margins']['right']}", T: {uni_data['margins']['top']}"</span>
-                    </li>
-                    <li class="flex justify-between border-b border-gray-50 pb-2">
-                        <span class="text-gray-500">Primary Font</span>
-                        <span class="font-medium text-gray-900">{uni_data['font']['name']} ({uni_data['font']['size']}pt)</span>
-                    </li>
-                    <li class="flex justify-between border-b border-gray-50 pb-2">
-                        <span class="text-gray-500">Line Spacing</span>
-                        <span class="font-medium text-gray-900">{uni_data['line_spacing']}</span>
-                    </li>
-                    <li class="flex justify-between">
-                        <span class="text-gray-500">Citation Style</span>
-                        <span class="font-medium text-purple-600">{uni_data.get('reference_style', 'Standard')}</span>
-                    </li>
-                </ul>
-            </div>
-        </div>
+def _json_str(value):
+    """JSON string escaping for a value dropped between quotes in a template."""
+    return json.dumps(value)[1:-1]
 
-        <!-- Column 2: Trust/Preview -->
-        <div>
-            <h3 class="text-xl font-bold text-gray-900 mb-6 transition-colors duration-200">Document Preview</h3>
-            
-            <!-- CSS-Only Document Preview -->
-            <div class="relative bg-gray-200 h-80 rounded-xl flex items-center justify-center p-4 border border-gray-300 shadow-inner overflow-hidden group">
-                <!-- The Paper -->
-                <div class="bg-white w-48 h-64 shadow-2xl rounded-sm transform transition-transform duration-500 group-hover:scale-105 group-hover:-rotate-1 relative flex flex-col items-center pt-8 px-4 border border-gray-100">
-                     <!-- Header Lines -->
-                     <div class="w-full h-2 bg-gray-100 mb-2"></div>
-                     <div class="w-3/4 h-2 bg-gray-100 mb-6"></div>
-                     
-                     <!-- Title -->
-                     <div class="text-[8px] font-serif text-center text-gray-800 font-bold mb-1 uppercase tracking-widest">{uni_name}</div>
-                     <div class="text-[6px] font-sans text-center text-blue-600 font-bold mb-4 uppercase tracking-wider">{course}</div>
-                     
-                     <!-- Body Lines -->
-                     <div class="w-full space-y-1">
-                        <div class="w-full h-1 bg-gray-100"></div>
-                        <div class="w-full h-1 bg-gray-100"></div>
-                        <div class="w-5/6 h-1 bg-gray-100"></div>
-                        <div class="w-full h-1 bg-gray-100"></div>
-                     </div>
-                     
-                     <!-- Footer -->
-                     <div class="mt-auto mb-4 w-full flex justify-between px-1">
-                         <div class="w-4 h-1 bg-gray-200"></div>
-                         <div class="w-2 h-1 bg-gray-200"></div>
-                     </div>
-                </div>
-                
-                <!-- Badge Overlay -->
-                 <div class="absolute bottom-4 right-4 bg-white/90 backdrop-blur px-3 py-1 rounded-full shadow-lg border border-gray-100 text-xs font-bold text-green-700 flex items-center gap-1">
-                    <span class="w-1.5 h-1.5 bg-green-500 rounded-full animate-pulse"></span>
-                    Preview
-                 </div>
-            </div>
-
-            <div class="mt-4 flex gap-4 text-sm text-gray-600 justify-center md:justify-start">
-                 <div class="flex items-center gap-1">
-                    <svg class="w-4 h-4 text-green-500" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M9 12l2 2 4-4m6 2a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>
-                    <span>Virus Checked</span>
-                 </div>
-                 <div class="flex items-center gap-1">
-                    <svg class="w-4 h-4 text-green-500" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M12 8v4l3 3m6-3a9 9 0 11-18 0 9 9 0 0118 0z"></path></svg>
-                    <span>Updated Jan 2026</span>
-                 </div>
-            </div>
-        </div>
-    </div>
-
-    <!-- Footer -->
-    <div class="bg-gray-50 border-t border-gray-200 py-12 text-center">
-        <p class="text-sm text-gray-400 max-w-lg mx-auto">
-            Disclaimer: This template is a student aid generated based on publicly available university guidelines. 
-            Always verify with your specific department before final submission.
-        </p>
-        <p class="text-xs text-gray-300 mt-4">Generative Thesis Factory © 2026</p>
-    </div>
-
-</body>
-</html>
+def build_tailwind_css():
+    """
+    Compiles only the Tailwind classes the pages use into one minified
+    stylesheet in OUTPUT_DIR (needs Node / npx), named after the generator
+    and template fingerprint. An existing build for that fingerprint is
+    reused without running npx; older builds are deleted.
+    Returns its file name, or None if the build failed.
     """
-    with open(html_path, 'w') as f:
-        f.write(html_content)
+    css_name = f"tailwind.{_CODE_DIGEST.hex()[:16]}.css"
+    css_path = os.path.join(OUTPUT_DIR, css_name)
+    if os.path.exists(css_path):
+        return css_name
+    # Class names live in the templates and in the HTML fragments in this file.
+    content = ",".join([os.path.join(TEMPLATE_DIR, "*.html"), os.path.abspath(__file__)])
+    try:
+        result = subprocess.run(
+            ["npx", "--yes", "tailwindcss@3", "--content", content, "--minify"],
+            check=True, capture_output=True, timeout=TAILWIND_TIMEOUT,
+        )
+    except (OSError, subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
+        print(f"⚠️ Tailwind build failed, falling back to the CDN: {e}")
+        return None
+    write_file(css_path, result.stdout)
+    for old_path in glob.glob(os.path.join(OUTPUT_DIR, "tailwind.*.css")):
+        if old_path != css_path:
+            os.remove(old_path)
+    return css_name
+
+def _stylesheet_tag(css_name, prefix=""):
+    """<head> tag loading Tailwind: the compiled stylesheet, or the CDN script."""
+    if css_name is None:
+        return TAILWIND_CDN_TAG
+    return f'<link rel="stylesheet" href="{prefix}{css_name}">'
+
+def generate_web_page(uni_data, uni_name, course, doc_name, css_name=None):
+    """Generates an SEO-optimized HTML landing page with SaaS-grade Trust UI (Tailwind)."""
+    doc_link = doc_name
+    year = uni_data['year']
+    verified_year = uni_data['verified_year']
+    margins, font = uni_data['margins'], uni_data['font']
+    m_left, font_name = margins['left'], font['name']
+    current_year = 2026
 
-def generate_global_index(universities):
-    """Generates the main homepage with client-side search (Tailwind Style)."""
+    # Logic: Data Decay Warning
+    decay_warning_html = ""
+    verified_badge_html = ""
+    
+    if verified_year < current_year:
+        decay_warning_html = _DECAY_WARNING_TMPL.substitute(verified_year=verified_year, current_year=current_year)
+    else:
+        verified_badge_html = _VERIFIED_BADGE_TMPL.substitute(verified_year=verified_year)
+
+    # JSON-LD Data (only the string leaves vary; the structure is pre-formatted)
+    json_ld = _JSON_LD_TMPL.substitute(
+        name=_json_str(f"{uni_name} Thesis Template {year}"),
+        description=_json_str(f"Official {year} compliant thesis template for {uni_name} {course}. Features correct {m_left} inch margins, {font_name} font, and auto-generated Table of Contents."),
+        brand=_json_str(uni_name),
+    )
+
+    html_content = _UNI_PAGE_TMPL.substitute(
+        stylesheet_tag=_stylesheet_tag(css_name, "../"),
+        uni_name=uni_name,
+        year=year,
+        course=course,
+        json_ld=json_ld,
+        verified_badge_html=verified_badge_html,
+        decay_warning_html=decay_warning_html,
+        doc_link=doc_link,
+        margin_left=m_left,
+        margin_right=margins['right'],
+        margin_top=margins['top'],
+        font_name=font_name,
+        font_size=font['size'],
+        line_spacing=uni_data['line_spacing'],
+        reference_style=uni_data['reference_style'],
+    )
+    return html_content
+
+def generate_global_index(universities, force=False, css_name=None):
+    """
+    Generates the main homepage with client-side search (Tailwind Style).
+    Returns False (and writes nothing) when the index is already up to date.
+    """
     index_path = os.path.join(OUTPUT_DIR, "index.html")
+    stamp_path = os.path.join(OUTPUT_DIR, STAMP_FILE)
+    key = build_key(universities, css_name)
+    if (not force and read_stamp(stamp_path) == key
+            and os.path.exists(index_path) and os.path.exists(index_path + ".gz")):
+        return False
     
     # Pre-render list items for SEO
-    list_items = ""
-    for uni in universities:
-        link = f"{uni['id']}/index.html"
-        list_items += f"""
-        <li class="uni-item group bg-white border border-gray-200 rounded-lg hover:shadow-md transition-shadow duration-200">
-            <a href="{link}" class="block p-5">
+    list_items = "".join(f"""
+        <li data-idx="{i}" class="uni-item group bg-white border border-gray-200 rounded-lg hover:shadow-md transition-shadow duration-200">
+            <a href="{uni["id"]}/index.html" class="block p-5">
                 <div class="flex items-center justify-between">
                     <div>
                         <h3 class="text-lg font-bold text-gray-900 group-hover:text-blue-600">{uni["uni_name"]}</h3>
@@ -543,108 +766,51 @@ def generate_global_index(universities):
                 </div>
             </a>
         </li>
-        """
-
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Global Thesis Factory | Download 2026 University Templates</title>
-    <meta name="description" content="Search and download free, compliant thesis templates for universities worldwide. MIT, Harvard, Oxford, Cambridge, and more.">
-    <script src="https://cdn.tailwindcss.com"></script>
-</head>
-<body class="bg-gray-50 text-gray-800 font-sans">
-
-    <div class="max-w-3xl mx-auto px-4 py-16">
-        <div class="text-center mb-12">
-            <h1 class="text-4xl md:text-5xl font-extrabold text-gray-900 mb-4 tracking-tight">
-                🎓 Thesis Template Factory
-            </h1>
-            <p class="text-xl text-gray-600">
-                Free, compliant Word templates for 19+ top universities.
-            </p>
-        </div>
-
-        <!-- Search Box -->
-        <div class="relative mb-10">
-            <div class="absolute inset-y-0 left-0 pl-4 flex items-center pointer-events-none">
-                <svg class="h-6 w-6 text-gray-400" fill="none" stroke="currentColor" viewBox="0 0 24 24"><path stroke-linecap="round" stroke-linejoin="round" stroke-width="2" d="M21 21l-6-6m2-5a7 7 0 11-14 0 7 7 0 0114 0z"></path></svg>
-            </div>
-            <input type="text" id="search" onkeyup="filterList()" 
-                class="block w-full pl-12 pr-4 py-4 bg-white border border-gray-300 rounded-xl leading-5 placeholder-gray-400 focus:outline-none focus:ring-2 focus:ring-blue-500 focus:border-blue-500 text-lg shadow-sm" 
-                placeholder="Search your university (e.g. 'Oxford', 'MIT')..." autofocus>
-        </div>
+        """ for i, uni in enumerate(universities))
+
+    # Search index for the page script; "</" is escaped so a name can't close the <script>.
+    unis_json = json.dumps([uni["uni_name"].lower() for uni in universities]).replace("</", "<\\/")
+
+    html_content = _INDEX_PAGE_TMPL.substitute(
+        stylesheet_tag=_stylesheet_tag(css_name),
+        list_items=list_items,
+        unis_json=unis_json,
+    )
+    write_files([
+        (index_path, html_content),
+        (index_path + ".gz", gzip_html(html_content)),
+        (stamp_path, key),
+    ])
+    return True
 
-        <!-- List -->
-        <ul id="uniList" class="space-y-4 min-h-[200px]">
-            {list_items}
-        </ul>
-        
-        <!-- No Results State -->
-        <div id="noResults" class="hidden text-center py-12">
-            <div class="text-6xl mb-4">🔍</div>
-            <h3 class="text-xl font-bold text-gray-900">No universities found</h3>
-            <p class="text-gray-500 mt-2">Try searching for a different name or checking the spelling.</p>
-        </div>
-        
-        <div class="mt-12 text-center border-t border-gray-100 pt-8">
-            <p class="text-sm text-gray-400">
-                Can't find your university? <a href="https://github.com/tanishqug/thesis-factory/issues" class="underline hover:text-blue-600 transition-colors">Request it on GitHub.</a>
-            </p>
-            <div class="mt-4">
-                 <a href="https://github.com/tanishqug/thesis-factory" target="_blank" class="inline-flex items-center gap-2 text-gray-400 hover:text-gray-800 transition-colors text-xs font-medium bg-white px-3 py-1.5 rounded-full border border-gray-200 shadow-sm hover:shadow-md">
-                    <svg class="h-4 w-4" fill="currentColor" viewBox="0 0 24 24"><path d="M12 0c-6.626 0-12 5.373-12 12 0 5.302 3.438 9.8 8.207 11.387.599.111.793-.261.793-.577v-2.234c-3.338.726-4.033-1.416-4.033-1.416-.546-1.387-1.333-1.756-1.333-1.756-1.089-.745.083-.729.083-.729 1.205.084 1.839 1.237 1.839 1.237 1.07 1.834 2.807 1.304 3.492.997.107-.775.418-1.305.762-1.604-2.665-.305-5.467-1.334-5.467-5.931 0-1.311.469-2.381 1.236-3.221-.124-.303-.535-1.524.117-3.176 0 0 1.008-.322 3.301 1.23.957-.266 1.983-.399 3.003-.404 1.02.005 2.047.138 3.006.404 2.291-1.552 3.297-1.23 3.297-1.23.653 1.653.242 2.874.118 3.176.77.84 1.235 1.911 1.235 3.221 0 4.609-2.807 5.624-5.479 5.921.43.372.823 1.102.823 2.222v3.293c0 .319.192.694.801.576 4.765-1.589 8.199-6.086 8.199-11.386 0-6.627-5.373-12-12-12z"/></svg>
-                    Star on GitHub
-                 </a>
-            </div>
-        </div>
-    </div>
+# ---------------------------------------------------------
+# PARALLEL DRIVER
+# ---------------------------------------------------------
 
-    <script>
-        function filterList() {{
-            var input, filter, ul, li, div, h3, txtValue;
-            var visibleCount = 0;
-            
-            input = document.getElementById('search');
-            filter = input.value.toUpperCase();
-            ul = document.getElementById("uniList");
-            li = ul.getElementsByTagName("li");
-            noResults = document.getElementById("noResults");
-            
-            for (i = 0; i < li.length; i++) {{
-                h3 = li[i].getElementsByTagName("h3")[0];
-                txtValue = h3.textContent || h3.innerText;
-                if (txtValue.toUpperCase().indexOf(filter) > -1) {{
-                    li[i].style.display = "";
-                    visibleCount++;
-                }} else {{
-                    li[i].style.display = "none";
-                }}
-            }}
-            
-            // Toggle No Results Message
-            if (visibleCount === 0) {{
-                noResults.classList.remove("hidden");
-                ul.classList.add("hidden");
-            }} else {{
-                noResults.classList.add("hidden");
-                ul.classList.remove("hidden");
-            }}
-        }}
-    </script>
-</body>
-</html>
-    """
-    with open(index_path, 'w') as f:
-        f.write(html_content)
+def _worker(uni, force=False, css_name=None):
+    """
+    Builds one university (docx + README + web page) inside a pool process.
+    Returns (uni_id, error) so failures are reported by the parent.
+    """
+    uni_id = uni['id']
+    try:
+        build_university(uni, force, css_name)
+        return uni_id, None
+    except Exception as e:
+        return uni_id, str(e)
 
 # ---------------------------------------------------------
 # ENTRY POINT
 # ---------------------------------------------------------
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate thesis templates and landing pages from data.json.")
+    parser.add_argument("--force", action="store_true",
+                        help="rebuild every university, even if its output is up to date")
+    parser.add_argument("--tailwind", action="store_true",
+                        help="compile a local Tailwind stylesheet (needs npx) instead of using the CDN")
+    args = parser.parse_args()
+
     print("🏭 Starting Thesis Factory...")
     
     if not os.path.exists(DATA_FILE):
@@ -652,21 +818,41 @@ if __name__ == "__main__":
         sys.exit(1)
         
     try:
-        with open(DATA_FILE, 'r') as f:
-            universities = json.load(f)
-            
+        universities = load_universities(DATA_FILE)
+        
+        # Entries sharing an id write the same Output/<id>/ files, so they must
+        # never run in two workers at once. As in the old sequential loop, the
+        # last entry for an id wins.
+        builds = {}
         for uni in universities:
-            try:
-                process_university(uni)
-                # Build Web Page for this uni
-                target_dir = os.path.join(OUTPUT_DIR, uni.get("id"))
-                generate_web_page(target_dir, uni)
-            except Exception as e:
-                print(f"⚠️ Failed to process {uni.get('id', 'Unknown')}: {e}")
+            if uni['id'] in builds:
+                print(f"⚠️ Duplicate id {uni['id']}: only its last entry in {DATA_FILE} is built")
+            builds[uni['id']] = uni
+        
+        # Create every output directory serially before fanning out, so the
+        # workers never race on mkdir in the shared parent.
+        os.makedirs(OUTPUT_DIR, exist_ok=True)
+        for uni in builds.values():
+            os.makedirs(os.path.join(OUTPUT_DIR, uni['id']), exist_ok=True)
+        css_name = build_tailwind_css() if args.tailwind else None
+            
+        # Universities are independent: fan them out across all cores and
+        # report each one as soon as it finishes (completion order), so a
+        # slow university never holds back the results queued behind it.
+        workers = os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            worker = functools.partial(_worker, force=args.force, css_name=css_name)
+            futures = [executor.submit(worker, uni) for uni in builds.values()]
+            for future in as_completed(futures):
+                uni_id, error = future.result()
+                if error:
+                    print(f"⚠️ Failed to process {uni_id}: {error}")
         
         # Build Global Search Index
-        generate_global_index(universities)
-        print("🌍 Website generated at Output/index.html")
+        if generate_global_index(universities, args.force, css_name):
+            print("🌍 Website generated at Output/index.html")
+        else:
+            print("⏭️ Up to date: Output/index.html")
                 
         print("\n✨ All jobs completed.")
         